@@ -1,17 +1,15 @@
 # stdlib
-import sys
+import io
 import os
-import copy
-from typing import Any, List, Tuple, Optional, Union
-from abc import abstractmethod
-import inspect
+import concurrent.futures
+import math
+from typing import Any, List, Optional
 import itertools
 
 # third party
 import numpy as np
 import pandas as pd
 import torch
-from torch.utils.data import DataLoader
 import sympy as smp  # We use sympy to display mathematical expresssions
 from sklearn.metrics import (
     mean_squared_error,
@@ -22,24 +20,45 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Interpretability relative
-from .utils import data
 from .base import Explainer, Explanation
 
 # Interpretability absolute
-from interpretability.utils.pip import install
 from interpretability.exceptions import exceptions
 
 # symbolic-pursuit
-for retry in range(2):
-    try:
-        # third party
-        import symbolic_pursuit
+try:
+    # third party
+    from symbolic_pursuit import models
+except ImportError as e:
+    raise ImportError(
+        "The symbolic-pursuit package is required for the SymbolicPursuitExplainer. "
+        "Install it with `pip install interpretability[symbolic]` or `pip install symbolic-pursuit`."
+    ) from e
+
+
+# MeijerG.expression() and MeijerG.approx_expression() write their closed
+# forms over this symbol.
+_MEIJER_ARG = smp.Symbol("x", real=True)
+
 
-        break
-    except ImportError:
-        depends = ["symbolic-pursuit"]
-        install(depends)
-from symbolic_pursuit import models
+def _fit_seeded_candidate(model, X_fit, random_seed, argv, kwargs, dtype):
+    """
+    Fit one independently seeded SymbolicRegressor. Module-level so it can
+    be dispatched to a process pool worker by SymbolicPursuitExplainer.fit().
+    """
+    kwargs = dict(kwargs, random_seed=random_seed)
+    candidate = models.SymbolicRegressor(*argv, **kwargs)
+    try:
+        candidate.fit(model, X_fit)
+    # The same one-shot retry as fit(): the model may expect the other
+    # input representation
+    except TypeError:
+        if isinstance(X_fit, torch.Tensor):
+            X_fit = X_fit.numpy()
+        else:
+            X_fit = torch.from_numpy(np.ascontiguousarray(X_fit, dtype=dtype))
+        candidate.fit(model, X_fit)
+    return candidate
 
 
 class SymbolicPursuitExplanation(Explanation):
@@ -85,6 +104,10 @@ class SymbolicPursuitExplanation(Explanation):
 
 
 class SymbolicPursuitExplainer(Explainer):
+    # smp.init_printing() rebuilds SymPy's global printer settings each time
+    # it runs, so it is only worth doing once per process.
+    _printing_initialized = False
+
     def __init__(
         self, model: Any, X_explain: np.array, feature_names: List = [], *argv, **kwargs
     ) -> None:
@@ -105,8 +128,24 @@ class SymbolicPursuitExplainer(Explainer):
             baselines (List): Defaults to list(load_h().keys()),
             task_type (str): Either the string "classification" or "regression". Defaults to "regression",
             patience (int) : A hard limit on the number of optimisation loops in fit(). Defaults to  10,
+            n_jobs (int): If > 1, fit() runs this many independently seeded pursuits in parallel
+                processes (seeds random_seed, random_seed + 1, ...) and keeps the one that best
+                reproduces the model on X_explain. Defaults to 1,
+            dtype: The numpy dtype arrays are canonicalized to (contiguous layout) before they
+                reach the symbolic model or self.model, so fit-quality metrics are computed at
+                this precision. Defaults to np.float32,
         """
+        self.dtype = kwargs.pop("dtype", np.float32)
+        self.n_jobs = kwargs.pop("n_jobs", 1)
+        self._regressor_args = tuple(argv)
+        self._regressor_kwargs = dict(kwargs)
         self.model = model
+        self._is_torch_model = isinstance(model, torch.nn.Module)
+        self._model_preds_cache = {}
+        # Single background worker for summary_plot(async_render=True);
+        # created lazily on first use.
+        self._render_pool = None
+        self._pending_renders = []
         self.X_explain = X_explain
         self.model_fit_quality = None
         self.fit_quality = None
@@ -117,9 +156,27 @@ class SymbolicPursuitExplainer(Explainer):
 
         super().__init__()
 
-        smp.init_printing()
+        if not SymbolicPursuitExplainer._printing_initialized:
+            smp.init_printing()
+            SymbolicPursuitExplainer._printing_initialized = True
         self.symbolic_model = models.SymbolicRegressor(*argv, **kwargs)
 
+        # Memoized SymPy objects from the fitted symbolic model; rebuilding
+        # them on every explain() call walks the expression tree again.
+        self._expression = None
+        self._projections = None
+
+        # Compiled numeric kernels for the fitted symbolic expression.
+        # These are built once by _build_numeric_kernels() after fit().
+        self._expr_fn = None
+        self._torch_fn = None
+        self._kernel_symbols = None
+        self._term_weights = None
+        self._term_projections = None
+        self._term_projection_exprs = None
+        self._term_g_exprs = None
+        self._taylor_kernels = {}
+
     @staticmethod
     def name() -> str:
         return "symbolic_pursuit_explainer"
@@ -132,66 +189,383 @@ class SymbolicPursuitExplainer(Explainer):
         """
         Fit the symbolic Regressor
         """
-        # try to fit with numpy array (which works for some models e.g. sklearn models)
-        for retry in range(2):
+        # Torch models get a zero-copy tensor view, everything else (e.g.
+        # sklearn models) the raw array. self.X_explain is left untouched so
+        # that a re-fit starts from the data the user originally passed.
+        X_fit = self._as_model_input(self.X_explain)
+        best_candidate = self._fit_parallel(X_fit) if self.n_jobs > 1 else None
+        if best_candidate is not None:
+            self.symbolic_model = best_candidate
+        else:
             try:
-                self.symbolic_model.fit(self.model, self.X_explain)
-                break
-            # If that fails due to expecting a different type for X_explain try again with X_explain as a torch tensor
-            # This works for pytorch models
+                self.symbolic_model.fit(self.model, X_fit)
+            # If the backend guess was wrong, retry once with the other
+            # representation of X_explain
             except TypeError:
-                self.X_explain = torch.Tensor(self.X_explain)
+                if isinstance(X_fit, torch.Tensor):
+                    X_fit = X_fit.numpy()
+                else:
+                    X_fit = torch.from_numpy(
+                        np.ascontiguousarray(X_fit, dtype=self.dtype)
+                    )
+                self.symbolic_model.fit(self.model, X_fit)
         self.has_been_fit = True
+        self._expression = None
+        self._projections = None
+        self._build_numeric_kernels()
+
+    def _fit_parallel(self, X_fit):
+        """
+        Run self.n_jobs independently seeded pursuits in parallel processes
+        and return the candidate that best reproduces self.model on the
+        explanation data, in the spirit of multi-population symbolic
+        regression searches. Returns None when the parallel run cannot be
+        used (e.g. the model cannot be pickled), in which case the caller
+        falls back to a single serial fit.
+        """
+        base_seed = self._regressor_kwargs.get("random_seed", 42)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.n_jobs
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _fit_seeded_candidate,
+                        self.model,
+                        X_fit,
+                        base_seed + worker_id,
+                        self._regressor_args,
+                        self._regressor_kwargs,
+                        self.dtype,
+                    )
+                    for worker_id in range(self.n_jobs)
+                ]
+                candidates = [future.result() for future in futures]
+        except Exception as e:
+            # Exception, not BaseException: KeyboardInterrupt/SystemExit
+            # must abort the fit rather than fall back to a serial one.
+            print(f"Parallel fit failed ({e}); falling back to a serial fit.")
+            return None
+
+        reference = self._predict_model(X_fit)
+        losses = [
+            mean_squared_error(reference, candidate.predict(self.X_explain))
+            for candidate in candidates
+        ]
+        return candidates[int(np.argmin(losses))]
+
+    def _get_expression(self):
+        """Memoized self.symbolic_model.get_expression()."""
+        if self._expression is None:
+            self._expression = self.symbolic_model.get_expression()
+        return self._expression
+
+    def _get_projections(self):
+        """Memoized self.symbolic_model.get_projections()."""
+        if self._projections is None:
+            self._projections = self.symbolic_model.get_projections()
+        return self._projections
+
+    def _build_numeric_kernels(self):
+        """
+        Compile the fitted symbolic model into numeric kernels.
+
+        A fitted SymbolicRegressor is a weighted sum of Meijer G-functions,
+        each applied to a nonlinearly activated projection of the input
+        (terms_list holds the [meijer_g, v, w] triples). Its predict()
+        evaluates every G through a cached polynomial approximation, so
+        substituting the activated projections into those same polynomials
+        and lambdifying the sum reproduces predict() exactly while running
+        compiled NumPy (and, when possible, torch) code over whole batches.
+        The exact per-term G expressions are kept as well, so that feature
+        importance and Taylor expansions can evaluate their derivatives
+        directly instead of calling mpmath.taylor on every explain(). The
+        prediction and explanation kernels are gated independently: if part
+        of the fitted model falls outside the expected structure, that part
+        stays None and its callers fall back to the upstream code paths.
+        """
+        self._expr_fn = None
+        self._torch_fn = None
+        self._kernel_symbols = None
+        self._term_weights = None
+        self._term_projections = None
+        self._term_projection_exprs = None
+        self._term_g_exprs = None
+        self._taylor_kernels = {}
+
+        terms_list = getattr(self.symbolic_model, "terms_list", [])
+        dim = getattr(self.symbolic_model, "dim_x", 0)
+        if not terms_list or not dim:
+            return
+        # get_taylor() writes its expansions over X0..X{dim-1}
+        symbols = smp.symbols(f"X:{dim}")
+
+        try:
+            weights = []
+            projection_rows = []
+            projection_exprs = []
+            g_exprs = []
+            full_expression = smp.Integer(0)
+            for meijer_g, v, w in terms_list:
+                v = np.asarray(v, dtype=float)
+                # predict() scales each projection by 1 / (sqrt(d) * ||v||)
+                scale = 1.0 / (np.sqrt(dim) * np.linalg.norm(v))
+                if not np.isfinite(scale):
+                    return
+                raw_projection = sum(float(v[n]) * symbols[n] for n in range(dim))
+                if self.symbolic_model.task_type == "classification":
+                    activated = scale / (1 + smp.exp(-raw_projection))
+                else:
+                    # ReLU written as (u + |u|) / 2, which lambdifies for
+                    # both numpy and torch
+                    activated = scale * (raw_projection + smp.Abs(raw_projection)) / 2
+                full_expression += float(w) * meijer_g.approx_expression().subs(
+                    _MEIJER_ARG, activated
+                )
+                weights.append(float(w))
+                projection_rows.append(scale * v)
+                projection_exprs.append(
+                    sum(float(scale * v[n]) * symbols[n] for n in range(dim))
+                )
+                # exp_polar only tracks the branch; on the positive reals
+                # where predict() evaluates G it is a plain exponential
+                g_exprs.append(
+                    meijer_g.expression(x=_MEIJER_ARG).replace(smp.exp_polar, smp.exp)
+                )
+        except Exception:
+            return
+
+        try:
+            expr_fn = smp.lambdify(symbols, full_expression, modules="numpy")
+            # Exercise the kernel once: lambdify only surfaces unsupported
+            # functions at call time
+            expr_fn(*np.full((dim, 2), 0.5))
+            self._expr_fn = expr_fn
+            self._kernel_symbols = symbols
+        except Exception:
+            self._expr_fn = None
+            self._kernel_symbols = None
+        if self._expr_fn is not None:
+            try:
+                # A torch-targeting kernel as well, so tensor inputs can be
+                # evaluated on their own device in symbolic_predict
+                torch_fn = smp.lambdify(symbols, full_expression, modules=torch)
+                torch_fn(*torch.full((dim, 2), 0.5))
+                self._torch_fn = torch_fn
+            except Exception:
+                self._torch_fn = None
+
+        try:
+            self._term_weights = np.array(weights, dtype=float)
+            self._term_projections = np.asarray(projection_rows, dtype=float)
+            self._term_projection_exprs = projection_exprs
+            self._term_g_exprs = g_exprs
+            # Exercise one gradient kernel per term for the same reason
+            self._taylor_derivative_fns(1)
+        except Exception:
+            self._term_weights = None
+            self._term_projections = None
+            self._term_projection_exprs = None
+            self._term_g_exprs = None
+            self._taylor_kernels = {}
+
+    @staticmethod
+    def _lambdify_scalar(expression):
+        """
+        Lambdify a single-variable expression, preferring vectorized NumPy
+        and falling back to (scalar) mpmath for the special functions NumPy
+        has no implementation of, such as hyper and meijerg. Either way the
+        function is exercised once, because lambdify only surfaces
+        unsupported functions at call time.
+        """
+        try:
+            fn = smp.lambdify(_MEIJER_ARG, expression, modules="numpy")
+            fn(np.float64(0.5))
+            return fn
+        except Exception:
+            fn = smp.lambdify(_MEIJER_ARG, expression, modules="mpmath")
+            fn(0.5)
+            return fn
+
+    @staticmethod
+    def _as_real(value):
+        """
+        mpmath and complex-coefficient kernels can carry a tiny imaginary
+        residue; like the upstream library, only the real part is kept.
+        """
+        return complex(value).real
+
+    def _taylor_derivative_fns(self, order):
+        """
+        Per-term lambdified derivatives G, G', ..., G^(order) of the exact
+        Meijer G expressions. Built once per order and cached.
+        """
+        if order not in self._taylor_kernels:
+            kernels = []
+            for g_expr in self._term_g_exprs:
+                fns = []
+                derivative = g_expr
+                for _ in range(order + 1):
+                    fns.append(self._lambdify_scalar(derivative))
+                    derivative = smp.diff(derivative, _MEIJER_ARG)
+                kernels.append(fns)
+            self._taylor_kernels[order] = kernels
+        return self._taylor_kernels[order]
+
+    def _fast_feature_importance(self, x0):
+        """
+        Feature importance at x0 via the compiled kernels. Mirrors the
+        symbolic model's get_feature_importance: eps plus the signed sum,
+        over the active (x_k > 0) terms, of
+        w_k * G_k'(x_k) * v_kn / (sqrt(d) * ||v_k||).
+        """
+        x0 = np.asarray(x0, dtype=float).ravel()
+        term_inputs = self._term_projections @ x0
+        gradient_fns = self._taylor_derivative_fns(1)
+        importance = np.full(x0.shape[0], float(self.symbolic_model.eps))
+        for k, term_input in enumerate(term_inputs):
+            if term_input > 0:
+                importance = importance + (
+                    self._term_weights[k]
+                    * self._as_real(gradient_fns[k][1](term_input))
+                    * self._term_projections[k]
+                )
+        return list(importance)
+
+    def _assemble_taylor(self, term_inputs, derivative_values, order):
+        """
+        Build the symbolic Taylor polynomial from evaluated projection
+        values x_k and per-term derivative values. Mirrors the symbolic
+        model's get_taylor: a 1-D expansion in (P_k(X) - x_k)^n along each
+        projection, dropping terms with x_k <= 0.
+        """
+        taylor_expansion = smp.Integer(0)
+        for k, term_input in enumerate(term_inputs):
+            if term_input <= 0:
+                continue
+            for n in range(order + 1):
+                coefficient = (
+                    self._term_weights[k]
+                    * derivative_values[k][n]
+                    / math.factorial(n)
+                )
+                taylor_expansion += coefficient * (
+                    self._term_projection_exprs[k] - term_input
+                ) ** n
+        return taylor_expansion
+
+    def _fast_taylor(self, x0, order):
+        """
+        Taylor expansion of the symbolic model around x0, assembled from the
+        compiled derivative kernels rather than via mpmath.taylor at each
+        call. Inactive terms are never evaluated, as in get_taylor.
+        """
+        x0 = np.asarray(x0, dtype=float).ravel()
+        term_inputs = self._term_projections @ x0
+        derivative_fns = self._taylor_derivative_fns(order)
+        derivative_values = [
+            [self._as_real(fn(term_input)) for fn in fns] if term_input > 0 else None
+            for fns, term_input in zip(derivative_fns, term_inputs)
+        ]
+        return self._assemble_taylor(term_inputs, derivative_values, order)
+
+    def _canon(self, X):
+        """
+        Canonicalize an ndarray to a contiguous array of self.dtype, so the
+        downstream numeric code sees a SIMD-friendly layout rather than
+        strided or float64 data. Anything that is not an ndarray is passed
+        through unchanged.
+        """
+        if isinstance(X, np.ndarray):
+            return np.ascontiguousarray(X, dtype=self.dtype)
+        return X
+
+    def _as_model_input(self, arr):
+        """
+        Cast an array to the representation self.model expects. Torch models
+        get a tensor of self.dtype (float32 by default, matching a default
+        torch network); when the array already has that dtype and layout the
+        tensor is a zero-copy view sharing the ndarray's buffer, so neither
+        should be mutated through the other. Anything that is already a
+        tensor (or not an ndarray at all) is passed through unchanged.
+        """
+        if self._is_torch_model and isinstance(arr, np.ndarray):
+            return torch.from_numpy(np.ascontiguousarray(arr, dtype=self.dtype))
+        return arr
+
+    def _predict_model(self, X):
+        """
+        Run self.model on X. Torch models are evaluated under
+        torch.inference_mode() so no autograd bookkeeping is done and, when
+        the model lives on the GPU, the input is pinned and copied
+        host-to-device with non_blocking=True so the transfer overlaps with
+        compute; the predictions come back as a numpy array.
+        """
+        if not self._is_torch_model:
+            try:
+                predictions = self.model(X)
+            # The model may expect the other representation without being an
+            # nn.Module (e.g. a lambda wrapping a network); retry once with
+            # the converted input, as fit() does.
+            except TypeError:
+                if isinstance(X, torch.Tensor):
+                    predictions = self.model(X.detach().cpu().numpy())
+                else:
+                    predictions = self.model(
+                        torch.from_numpy(
+                            np.ascontiguousarray(X, dtype=self.dtype)
+                        )
+                    )
+            if isinstance(predictions, torch.Tensor):
+                predictions = predictions.detach().cpu().numpy()
+            return predictions
+        if isinstance(X, torch.Tensor):
+            tensor = X
+        else:
+            tensor = torch.from_numpy(np.ascontiguousarray(X))
+        parameter = next(self.model.parameters(), None)
+        if parameter is not None and parameter.is_cuda:
+            tensor = tensor.pin_memory().to(parameter.device, non_blocking=True)
+        with torch.inference_mode():
+            return self.model(tensor).cpu().numpy()
+
+    def _model_predictions(self, X_test):
+        """
+        Memoized self.model(X_test). For heavy models re-running inference
+        dominates measure_fit_quality, so predictions are cached per test
+        set (keyed on the array's identity, shape and dtype) and reused on
+        repeat calls. The cached array is stored alongside its predictions
+        and checked for identity on a hit, because id() values can be
+        recycled once an old test set is garbage collected.
+        """
+        key = (
+            id(X_test),
+            getattr(X_test, "shape", None),
+            str(getattr(X_test, "dtype", None)),
+        )
+        cached = self._model_preds_cache.get(key)
+        if cached is not None and cached[0] is X_test:
+            return cached[1]
+        predictions = self._predict_model(self._canon(X_test))
+        self._model_preds_cache[key] = (X_test, predictions)
+        return predictions
 
     def measure_fit_quality(self, X_test: np.array, y_test: np.array):
 
         if self.has_been_fit:
             self.X_test = X_test
             self.y_test = y_test
-            if self.symbolic_model.task_type == "classification":
-                for retry in range(2):
-                    try:
-                        self.fit_quality = accuracy_score(
-                            self.y_test, self.symbolic_model.predict(self.X_test)
-                        )
-                        break
-                    except TypeError:
-                        self.X_test = torch.Tensor(self.X_test)
-                        self.y_test = torch.Tensor(self.y_test)
-                for retry in range(2):
-                    try:
-                        self.model_fit_quality = accuracy_score(
-                            self.y_test, self.model(self.X_test)
-                        )
-                        break
-                    except TypeError:
-                        self.X_test = torch.Tensor(self.X_test)
-                        self.y_test = torch.Tensor(self.y_test)
-
-                print(f"Accuracy score for the model: {self.model_fit_quality}")
-                print(f"Accuracy score for the Symbolic Regressor: {self.fit_quality}")
-            elif self.symbolic_model.task_type == "regression":
-                for retry in range(2):
-                    try:
-                        self.fit_quality = mean_squared_error(
-                            self.y_test, self.symbolic_model.predict(self.X_test)
-                        )
-                        break
-                    except TypeError:
-                        self.X_test = torch.Tensor(self.X_test)
-                        self.y_test = torch.Tensor(self.y_test)
-                for retry in range(2):
-                    try:
-                        self.model_fit_quality = mean_squared_error(
-                            self.y_test, self.model(self.X_test)
-                        )
-                        break
-                    except TypeError:
-                        self.X_test = torch.Tensor(self.X_test)
-                        self.y_test = torch.Tensor(self.y_test)
+            score_name, score_fn = {
+                "classification": ("Accuracy", accuracy_score),
+                "regression": ("MSE", mean_squared_error),
+            }[self.symbolic_model.task_type]
+            self.fit_quality = score_fn(
+                y_test, self.symbolic_model.predict(self._canon(X_test))
+            )
+            self.model_fit_quality = score_fn(y_test, self._model_predictions(X_test))
 
-                print(f"MSE score for the model: {self.model_fit_quality}")
-                print(f"MSE score for the Symbolic Regressor: {self.fit_quality}")
+            print(f"{score_name} score for the model: {self.model_fit_quality}")
+            print(f"{score_name} score for the Symbolic Regressor: {self.fit_quality}")
         else:
             raise exceptions.MeasureFitQualityCalledBeforeFit(self.has_been_fit)
 
@@ -202,12 +576,17 @@ class SymbolicPursuitExplainer(Explainer):
         The function to get the explanation data from the explainer
         """
         if self.has_been_fit:
-            expression = self.symbolic_model.get_expression()
-            projections = self.symbolic_model.get_projections()
-            feature_importance = self.symbolic_model.get_feature_importance(x0)
-            taylor_expansion = self.symbolic_model.get_taylor(
-                x0, taylor_expansion_order
-            )
+            x0 = self._canon(x0)
+            expression = self._get_expression()
+            projections = self._get_projections()
+            if self._term_weights is not None:
+                feature_importance = self._fast_feature_importance(x0)
+                taylor_expansion = self._fast_taylor(x0, taylor_expansion_order)
+            else:
+                feature_importance = self.symbolic_model.get_feature_importance(x0)
+                taylor_expansion = self.symbolic_model.get_taylor(
+                    x0, taylor_expansion_order
+                )
             self.explanation = SymbolicPursuitExplanation(
                 expression,
                 projections,
@@ -221,16 +600,136 @@ class SymbolicPursuitExplainer(Explainer):
         else:
             raise exceptions.ExplainCalledBeforeFit(self.has_been_fit)
 
+    def explain_batch(
+        self, X0: np.array, taylor_expansion_order: int = 2
+    ) -> List[SymbolicPursuitExplanation]:
+        """
+        Explain many records at once.
+
+        Each compiled derivative kernel is evaluated over the whole X0
+        matrix in a single vectorized call, so the per-record cost is only
+        the assembly of its Taylor polynomial rather than one SymPy
+        traversal per record.
+
+        Args:
+            X0 (np.array): A 2D array with one record to explain per row.
+            taylor_expansion_order (int): The order of the Taylor expansions. Defaults to 2.
+
+        Returns:
+            List[SymbolicPursuitExplanation]: One explanation per row of X0.
+        """
+        if not self.has_been_fit:
+            raise exceptions.ExplainCalledBeforeFit(self.has_been_fit)
+        if self._term_weights is None:
+            # No compiled kernels available; fall back to per-record evaluation
+            return [self.explain(x0, taylor_expansion_order) for x0 in X0]
+
+        X0 = np.asarray(X0, dtype=float)
+        expression = self._get_expression()
+        projections = self._get_projections()
+        eps = float(self.symbolic_model.eps)
+        term_inputs = X0 @ self._term_projections.T
+        gates = term_inputs > 0
+        derivative_fns = self._taylor_derivative_fns(max(taylor_expansion_order, 1))
+
+        def evaluate_batch(fn, values):
+            # Vectorized when the kernel is NumPy-backed, element-wise for
+            # the scalar mpmath fallbacks; constants broadcast to a column
+            try:
+                result = np.asarray(fn(values), dtype=complex).real
+            except Exception:
+                result = np.array([self._as_real(fn(value)) for value in values])
+            return np.broadcast_to(result.astype(float), values.shape)
+
+        # derivative_columns[k][n][i] = G_k^(n) at record i's projection,
+        # evaluated only where the term is active (x_k > 0)
+        derivative_columns = []
+        for k, fns in enumerate(derivative_fns):
+            active = gates[:, k]
+            columns = []
+            for fn in fns:
+                column = np.zeros(X0.shape[0])
+                if active.any():
+                    column[active] = evaluate_batch(fn, term_inputs[active, k])
+                columns.append(column)
+            derivative_columns.append(columns)
+
+        gradient_values = np.stack(
+            [columns[1] for columns in derivative_columns], axis=1
+        )
+        importance_matrix = (
+            eps + (gates * gradient_values * self._term_weights) @ self._term_projections
+        )
+
+        explanations = []
+        for row in range(X0.shape[0]):
+            derivative_values = [
+                [
+                    float(column[row])
+                    for column in columns[: taylor_expansion_order + 1]
+                ]
+                for columns in derivative_columns
+            ]
+            taylor_expansion = self._assemble_taylor(
+                term_inputs[row], derivative_values, taylor_expansion_order
+            )
+            explanations.append(
+                SymbolicPursuitExplanation(
+                    expression,
+                    projections,
+                    X0[row],
+                    list(importance_matrix[row]),
+                    taylor_expansion,
+                    self.model_fit_quality,
+                    self.fit_quality,
+                )
+            )
+        return explanations
+
+    def _submit_render(self, render):
+        """Queue a render closure on the single background render thread."""
+        if self._render_pool is None:
+            self._render_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        future = self._render_pool.submit(render)
+        self._pending_renders.append(future)
+        return future
+
+    def wait_for_plots(self):
+        """
+        Block until every render queued by summary_plot(async_render=True)
+        has finished, re-raising any error the renders hit.
+        """
+        pending, self._pending_renders = self._pending_renders, []
+        for future in pending:
+            future.result()
+
+    def __del__(self):
+        if getattr(self, "_render_pool", None) is not None:
+            self._render_pool.shutdown(wait=False)
+
     def summary_plot(
         self,
         file_prefilx="symbolic_pursuit",
         show_expression=True,
         show_feature_importance=True,
         show_feature_interactions=True,
-        save_folder=".",
+        save_folder=None,
+        use_latex=True,
+        async_render=False,
     ):
         """
-        Plot the latex'ed equations if latex installed
+        Plot the latex'ed equations if latex installed. With
+        `use_latex=False` the expression is rendered in-process with
+        matplotlib's mathtext instead, which avoids spawning the
+        latex -> dvi -> png pipeline (and works without a latex install).
+        With `async_render=True` the latex render runs on a background
+        thread (the latex subprocess releases the GIL) so this method
+        returns immediately; the image is saved/displayed when the render
+        completes, and wait_for_plots() blocks until all queued renders
+        have finished. The mathtext path (`use_latex=False`) always renders
+        synchronously, because matplotlib is not thread-safe. The
+        expression is rendered into an in-memory buffer and only written
+        to disk when `save_folder` is given.
         """
 
         def create_coefficient_heatmap_from_second_order_taylor_expansion(
@@ -261,22 +760,63 @@ class SymbolicPursuitExplainer(Explainer):
 
         if show_expression:
             """Show image of latex'ed expression if possible else print expression to console. Print projections to console."""
-            try:
+            if save_folder is not None:
                 save_path_stem = os.path.abspath(save_folder)
                 save_path_stem = os.path.join(save_path_stem, file_prefilx)
-                smp.preview(
-                    self.explanation.expression,
-                    viewer="file",
-                    filename=save_path_stem + "_expression.png",
-                    dvioptions=["-D", "1200"],
-                )
-                expression_img = Image.open(save_path_stem + "_expression.png")
-                expression_img.show()
-            except RuntimeError as e:
-                print(
-                    "For an output that does not require latex set `show_expression=False`."
-                )
-                raise e
+            else:
+                save_path_stem = None
+            expression = self.explanation.expression
+
+            def render_expression():
+                if use_latex:
+                    try:
+                        # Render into an in-memory buffer; the disk
+                        # round-trip is only taken when a save was requested
+                        buffer = io.BytesIO()
+                        smp.preview(
+                            expression,
+                            viewer="BytesIO",
+                            outputbuffer=buffer,
+                            output="png",
+                            dvioptions=["-D", "1200"],
+                        )
+                        expression_img = Image.open(buffer)
+                        if save_path_stem is not None:
+                            expression_img.save(save_path_stem + "_expression.png")
+                        try:
+                            # Display inline if in a Notebook, rather than
+                            # spawning an external image viewer process
+                            display(expression_img)
+                        except:
+                            expression_img.show()
+                    except RuntimeError as e:
+                        print(
+                            "For an output that does not require a latex install set `use_latex=False`, or set `show_expression=False` to print the expression instead."
+                        )
+                        raise e
+                else:
+                    # matplotlib mathtext renders in-process, so no latex
+                    # subprocess is spawned.
+                    fig, ax = plt.subplots()
+                    ax.axis("off")
+                    ax.text(
+                        0.5,
+                        0.5,
+                        f"${smp.latex(expression)}$",
+                        ha="center",
+                        va="center",
+                    )
+                    if save_path_stem is not None:
+                        fig.savefig(
+                            save_path_stem + "_expression.png",
+                            bbox_inches="tight",
+                        )
+                    plt.show()
+
+            if async_render and use_latex:
+                self._submit_render(render_expression)
+            else:
+                render_expression()
         else:
             print(self.explanation.expression)
         self.symbolic_model.print_projections()
@@ -314,4 +854,51 @@ class SymbolicPursuitExplainer(Explainer):
         self,
         predict_array: np.array,
     ):
+        """
+        Predict with the symbolic model. When the compiled expression kernel
+        is available the whole batch is evaluated in one vectorized NumPy
+        call over the feature columns, rather than row-by-row with SymPy
+        substitution inside the symbolic model. Torch tensors are accepted
+        natively: they are evaluated through a torch-targeting kernel on
+        whatever device they live on, and the predictions come back as a
+        tensor on that same device rather than round-tripping through the
+        CPU.
+        """
+        predict_array = self._canon(predict_array)
+        if isinstance(predict_array, torch.Tensor):
+            if (
+                self._torch_fn is not None
+                and predict_array.dim() == 2
+                and predict_array.shape[1] == len(self._kernel_symbols)
+            ):
+                with torch.inference_mode():
+                    predictions = self._torch_fn(*predict_array.unbind(dim=1))
+                if not isinstance(predictions, torch.Tensor):
+                    # A constant expression evaluates to a scalar
+                    predictions = torch.as_tensor(
+                        predictions, device=predict_array.device
+                    )
+                if predictions.is_complex():
+                    # predict() keeps the real part of the G evaluations
+                    predictions = predictions.real
+                return predictions.broadcast_to((predict_array.shape[0],)).clone()
+            # No torch kernel; evaluate on the CPU and move the result back
+            # to the caller's device
+            predictions = self.symbolic_predict(predict_array.detach().cpu().numpy())
+            return torch.as_tensor(
+                np.asarray(predictions), device=predict_array.device
+            )
+        if (
+            self._expr_fn is not None
+            and isinstance(predict_array, np.ndarray)
+            and predict_array.ndim == 2
+            and predict_array.shape[1] == len(self._kernel_symbols)
+        ):
+            columns = [predict_array[:, i] for i in range(predict_array.shape[1])]
+            # predict() keeps the real part of the G evaluations; a constant
+            # expression evaluates to a scalar, hence the broadcast
+            predictions = np.real(np.asarray(self._expr_fn(*columns)))
+            return np.broadcast_to(
+                predictions.astype(float), (predict_array.shape[0],)
+            ).copy()
         return self.symbolic_model.predict(predict_array)
@@ -0,0 +1,215 @@
+"""Tests for the compiled numeric kernels of the SymbolicPursuitExplainer."""
+
+import numpy as np
+import pytest
+import sympy as smp
+import torch
+
+pytest.importorskip("symbolic_pursuit")
+
+from symbolic_pursuit.models import SymbolicRegressor
+from symbolic_pursuit.pysymbolic.models.special_functions import MeijerG
+
+from interpretability.interpretability_models.symbolic_pursuit_explainer import (
+    SymbolicPursuitExplainer,
+    _fit_seeded_candidate,
+)
+
+
+def predictive_model(X):
+    X = np.asarray(X)
+    return X[:, 0] + 0.5 * X[:, 1]
+
+
+torch.manual_seed(0)
+_network = torch.nn.Linear(2, 1)
+
+
+def tensor_only_model(X):
+    """A callable that requires float32 tensors without being an nn.Module."""
+    return _network(X).detach().numpy().squeeze()
+
+
+def minimal_fit_config():
+    """A configuration small enough to keep a pursuit down to a few seconds."""
+    return dict(
+        patience=1,
+        maxiter=1,
+        ratio_tol=2.0,
+        baselines=["hyper_2"],
+        random_seed=0,
+    )
+
+
+@pytest.fixture(scope="module")
+def fitted_explainer():
+    """An explainer fitted for real, on a cheap pursuit configuration."""
+    X_explain = np.random.RandomState(0).uniform(0, 1, (10, 2))
+    explainer = SymbolicPursuitExplainer(
+        predictive_model,
+        X_explain,
+        dtype=np.float64,
+        **minimal_fit_config(),
+    )
+    explainer.fit()
+    return explainer
+
+
+@pytest.fixture(scope="module")
+def synthetic_explainer():
+    """
+    An explainer wrapping a hand-built SymbolicRegressor with one term from
+    each baseline family, so the kernels can be checked against the upstream
+    results without paying for a pursuit.
+    """
+    X_explain = np.random.RandomState(1).uniform(0, 1, (40, 3))
+    explainer = SymbolicPursuitExplainer(
+        predictive_model, X_explain, dtype=np.float64
+    )
+    regressor = SymbolicRegressor(task_type="regression")
+    regressor.dim_x = 3
+    regressor.n_points = len(X_explain)
+    regressor.terms_list = [
+        [
+            MeijerG(theta=[0.5, 0.0, 1.0], order=[1, 0, 0, 2]),
+            np.array([0.8, -0.2, 0.4]),
+            1.3,
+        ],
+        [
+            MeijerG(theta=[2.0, 2.0, 2.0, 1.0, 1.0], order=[0, 1, 3, 1]),
+            np.array([0.5, 0.7, -0.1]),
+            -0.7,
+        ],
+        [
+            MeijerG(theta=[0.3, 0.1, 0.1, 0.0, 0.3, 1.0], order=[2, 1, 2, 3]),
+            np.array([0.3, 0.3, 0.3]),
+            0.4,
+        ],
+    ]
+    explainer.symbolic_model = regressor
+    explainer.has_been_fit = True
+    explainer._build_numeric_kernels()
+    return explainer
+
+
+def assert_expressions_close(left, right, tol=1.0e-8):
+    coefficients = smp.expand(left - right).as_coefficients_dict()
+    residue = max((abs(complex(c)) for c in coefficients.values()), default=0.0)
+    assert residue < tol
+
+
+def test_fit_retries_with_float32_tensors():
+    # The model raises TypeError on ndarray input and its network is
+    # float32, so the retry must hand it a float32 tensor
+    X_explain = np.random.RandomState(0).uniform(0, 1, (10, 2))
+    explainer = SymbolicPursuitExplainer(
+        tensor_only_model, X_explain, **minimal_fit_config()
+    )
+    explainer.fit()
+    assert explainer.has_been_fit
+
+
+def test_seeded_candidate_retries_with_tensors():
+    # The parallel-fit worker needs the same input-representation retry as
+    # fit(), or every worker dies on a tensor-only model
+    X_fit = np.random.RandomState(0).uniform(0, 1, (10, 2))
+    candidate = _fit_seeded_candidate(
+        tensor_only_model, X_fit, 0, (), minimal_fit_config(), np.float32
+    )
+    assert isinstance(candidate, SymbolicRegressor)
+    assert candidate.n_points == len(X_fit)
+
+
+def test_kernels_are_built_after_fit(fitted_explainer):
+    assert len(fitted_explainer.symbolic_model.terms_list) > 0
+    assert fitted_explainer._expr_fn is not None
+    assert fitted_explainer._term_weights is not None
+
+
+def test_symbolic_predict_is_vectorized_and_matches(fitted_explainer, monkeypatch):
+    X = np.asarray(fitted_explainer.X_explain)
+    upstream = fitted_explainer.symbolic_model.predict(X)
+    # The vectorized kernel must answer on its own, without falling back to
+    # the symbolic model's row-by-row predict()
+    monkeypatch.setattr(
+        fitted_explainer.symbolic_model,
+        "predict",
+        lambda *args, **kwargs: pytest.fail(
+            "fell back to SymbolicRegressor.predict"
+        ),
+    )
+    fast = fitted_explainer.symbolic_predict(X)
+    np.testing.assert_allclose(fast, upstream, rtol=1.0e-6, atol=1.0e-8)
+
+
+def test_symbolic_predict_accepts_torch_tensors(fitted_explainer, monkeypatch):
+    X = np.asarray(fitted_explainer.X_explain)
+    upstream = fitted_explainer.symbolic_model.predict(X)
+    assert fitted_explainer._torch_fn is not None
+    # Tensors must be evaluated through the torch kernel, not through the
+    # detach().cpu().numpy() round-trip
+    monkeypatch.setattr(
+        fitted_explainer,
+        "_expr_fn",
+        lambda *args, **kwargs: pytest.fail("round-tripped through numpy"),
+    )
+    monkeypatch.setattr(
+        fitted_explainer.symbolic_model,
+        "predict",
+        lambda *args, **kwargs: pytest.fail(
+            "fell back to SymbolicRegressor.predict"
+        ),
+    )
+    predictions = fitted_explainer.symbolic_predict(torch.from_numpy(X.copy()))
+    assert isinstance(predictions, torch.Tensor)
+    np.testing.assert_allclose(
+        predictions.numpy(), upstream, rtol=1.0e-6, atol=1.0e-8
+    )
+
+
+def test_feature_importance_matches_symbolic_model(synthetic_explainer):
+    for x0 in synthetic_explainer.X_explain[:5]:
+        fast = np.array(
+            synthetic_explainer.explain(x0).feature_importance, dtype=float
+        )
+        upstream = np.array(
+            [
+                float(value)
+                for value in synthetic_explainer.symbolic_model.get_feature_importance(
+                    x0
+                )
+            ]
+        )
+        np.testing.assert_allclose(fast, upstream, rtol=1.0e-6, atol=1.0e-8)
+
+
+def test_explain_batch_matches_explain(synthetic_explainer, monkeypatch):
+    X0 = synthetic_explainer.X_explain[:5]
+    with monkeypatch.context() as context:
+        # The batch path must answer on its own, not loop over explain()
+        context.setattr(
+            synthetic_explainer,
+            "explain",
+            lambda *args, **kwargs: pytest.fail(
+                "fell back to per-record explain"
+            ),
+        )
+        batch = synthetic_explainer.explain_batch(X0, taylor_expansion_order=2)
+    for x0, explanation in zip(X0, batch):
+        single = synthetic_explainer.explain(x0, taylor_expansion_order=2)
+        np.testing.assert_allclose(
+            np.array(explanation.feature_importance, dtype=float),
+            np.array(single.feature_importance, dtype=float),
+            rtol=1.0e-6,
+            atol=1.0e-8,
+        )
+        assert_expressions_close(
+            explanation.taylor_expansion, single.taylor_expansion
+        )
+
+
+def test_taylor_expansion_matches_symbolic_model(synthetic_explainer):
+    for x0 in synthetic_explainer.X_explain[:3]:
+        fast = synthetic_explainer.explain(x0, taylor_expansion_order=2)
+        upstream = synthetic_explainer.symbolic_model.get_taylor(x0, 2)
+        assert_expressions_close(fast.taylor_expansion, upstream)